@@ -4,25 +4,41 @@ Technique Reference: Python Backend #40-41
 """
 
 from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
+import anyio
 import asyncio
 import json
 
 app = FastAPI()
 
+# Tokens sent per SSE frame; larger chunks mean fewer frames and event-loop trips
+CHUNK_SIZE = 4
+
+# Per-chunk delay to mimic model latency (0 disables it)
+SIMULATED_DELAY = 0.0
+
 async def generate_ai_stream(prompt: str):
     """Simulate streaming AI response"""
     response = "This is a simulated AI response that streams token by token."
     
+    buffer = []
     for token in response.split():
-        await asyncio.sleep(0.1)  # Simulate processing
-        yield f"data: {json.dumps({'token': token})}\n\n"
+        buffer.append(token)
+        if len(buffer) == CHUNK_SIZE:
+            if SIMULATED_DELAY:
+                await asyncio.sleep(SIMULATED_DELAY)  # Simulate processing
+            yield f"data: {json.dumps({'tokens': buffer})}\n\n"
+            buffer = []
+    
+    if buffer:
+        yield f"data: {json.dumps({'tokens': buffer})}\n\n"
     
     yield "data: [DONE]\n\n"
 
 @app.post("/api/chat/stream")
 async def stream_chat(prompt: str):
     """Streaming chat endpoint"""
+    # An async generator keeps streaming on the event loop instead of a threadpool
     return StreamingResponse(
         generate_ai_stream(prompt),
         media_type="text/event-stream",
@@ -32,4 +48,29 @@ async def stream_chat(prompt: str):
         }
     )
 
+def read_batch(producer, size: int) -> list:
+    """Pull up to size tokens from a blocking iterator"""
+    return [token for _, token in zip(range(size), producer)]
+
+async def stream_blocking_producer(producer):
+    """Stream a blocking token source, hopping to a worker thread once per chunk"""
+    while True:
+        buffer = await anyio.to_thread.run_sync(read_batch, producer, CHUNK_SIZE)
+        if not buffer:
+            break
+        yield f"data: {json.dumps({'tokens': buffer})}\n\n"
+    
+    yield "data: [DONE]\n\n"
+
+@app.get("/api/chat/transcript")
+async def download_transcript():
+    """Serve a pre-rendered response from disk"""
+    # FileResponse streams from the file itself (zero-copy sendfile where the
+    # ASGI server supports it) instead of a generator over open(...)
+    return FileResponse(
+        "out.txt",
+        media_type="text/plain",
+        headers={"X-Accel-Buffering": "no"}
+    )
+
 # Run with: uvicorn streaming_response:app --reload
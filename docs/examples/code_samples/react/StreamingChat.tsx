@@ -51,7 +51,7 @@ export function StreamingChat() {
 
             try {
               const parsed = JSON.parse(data);
-              aiResponse += ' ' + parsed.token;
+              aiResponse += ' ' + parsed.tokens.join(' ');
               setMessages(prev => {
                 const newMessages = [...prev];
                 const lastMessage = newMessages[newMessages.length - 1];
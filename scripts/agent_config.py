@@ -22,15 +22,55 @@ Features:
 - Export/import configurations
 """
 
+import os
 import json
 import sys
 import argparse
+import itertools
+import threading
+from collections import deque
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Top-level scalar fields shown by `list`
+HEADER_FIELDS = ('name', 'type', 'version')
+HEADER_PREFIXES = tuple(f"{field}:" for field in HEADER_FIELDS)
+
+NAME_RE = re.compile(r'^[a-z0-9_-]+$')
+VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def write_stdout(data: bytes) -> None:
+    """Write bytes to stdout after anything already printed"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
 class Colors:
     RED = '\033[91m'
     GREEN = '\033[92m'
@@ -62,16 +102,22 @@ class AgentConfig:
         """Initialize agent configuration manager"""
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
+        # Parsed configs keyed by path, validated against (st_mtime_ns, st_size)
+        self._cache: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+        # Sorted agent names, validated against the directory's st_mtime_ns
+        self._list_cache: Optional[Tuple[int, List[str]]] = None
+        self._cache_lock = threading.Lock()
         
     def create_default_config(self, agent_name: str) -> Dict[str, Any]:
         """Create default agent configuration"""
+        now = datetime.now().isoformat()
         return {
             'name': agent_name,
             'version': '1.0.0',
             'type': 'worker',
             'description': f'Agent: {agent_name}',
-            'created': datetime.now().isoformat(),
-            'updated': datetime.now().isoformat(),
+            'created': now,
+            'updated': now,
             'capabilities': [],
             'dependencies': [],
             'configuration': {
@@ -106,12 +152,12 @@ class AgentConfig:
         
         # Validate name
         if 'name' in config:
-            if not re.match(r'^[a-z0-9_-]+$', config['name']):
+            if not NAME_RE.match(config['name']):
                 errors.append("Agent name must contain only lowercase letters, numbers, hyphens, and underscores")
         
         # Validate version
         if 'version' in config:
-            if not re.match(r'^\d+\.\d+\.\d+$', config['version']):
+            if not VERSION_RE.match(config['version']):
                 errors.append("Version must follow semantic versioning (x.y.z)")
         
         # Validate type
@@ -138,35 +184,134 @@ class AgentConfig:
         config_file = self.config_dir / f"{agent_name}.yaml"
         
         try:
+            with self._cache_lock:
+                self._cache.pop(config_file, None)
+                self._list_cache = None
             with open(config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=Dumper, default_flow_style=False)
             print_success(f"Saved: {config_file}")
             return True
         except Exception as e:
             print_error(f"Failed to save configuration: {e}")
             return False
     
-    def load_agent(self, agent_name: str) -> Optional[Dict[str, Any]]:
-        """Load agent configuration from file"""
+    def load_agent(self, agent_name: str, cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Load agent configuration from file, keeping it in the cache unless cache is False"""
         config_file = self.config_dir / f"{agent_name}.yaml"
         
-        if not config_file.exists():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
             print_error(f"Agent not found: {agent_name}")
             return None
         
+        # Reuse the parsed config while the file is unchanged on disk
+        with self._cache_lock:
+            cached = self._cache.get(config_file)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
         try:
             with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+                config = yaml.load(f, Loader=Loader)
         except Exception as e:
             print_error(f"Failed to load configuration: {e}")
             return None
+        
+        if cache:
+            with self._cache_lock:
+                self._cache[config_file] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+    
+    def load_agent_header(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Load only the name, type and version of an agent without a full parse.
+        
+        Files with repeated header keys or more than one YAML document fall back
+        to load_agent(). Syntax errors outside the header lines are not detected,
+        so `list` can show an agent that `info` and `validate` reject.
+        """
+        config_file = self.config_dir / f"{agent_name}.yaml"
+        header_lines = []
+        seen_fields = set()
+        has_content = False
+        
+        try:
+            with open(config_file, 'r') as f:
+                in_header_value = False
+                for line in f:
+                    # A document marker after content starts a second document
+                    if has_content and line.startswith(('---', '...')) and line[3:].strip()[:1] in ('', '#'):
+                        return self.load_agent(agent_name)
+                    if line.strip() and not line.startswith(('#', '---')):
+                        has_content = True
+                    
+                    # An indented line straight after a header field continues its value
+                    if in_header_value and line[:1].isspace() and line.strip():
+                        return self.load_agent(agent_name)
+                    
+                    in_header_value = line.startswith(HEADER_PREFIXES)
+                    if not in_header_value:
+                        continue
+                    
+                    # The full parse keeps the last of repeated keys
+                    field, value = line.split(':', 1)
+                    if field in seen_fields:
+                        return self.load_agent(agent_name)
+                    seen_fields.add(field)
+                    
+                    value = value.strip()
+                    if not value or value[0] in '|>':
+                        return self.load_agent(agent_name)
+                    
+                    header_lines.append(line)
+            
+            header = yaml.load(''.join(header_lines), Loader=Loader)
+        except Exception:
+            # Missing or unusual files are reported by the full loader
+            return self.load_agent(agent_name)
+        
+        if not isinstance(header, dict) or not all(field in header for field in HEADER_FIELDS):
+            return self.load_agent(agent_name)
+        
+        return header
+    
+    def load_agents(self, agent_names: Iterable[str], header_only: bool = False) -> List[Optional[Dict[str, Any]]]:
+        """Load several agent configurations concurrently, preserving order"""
+        load = self.load_agent_header if header_only else self.load_agent
+        agent_names = list(agent_names)
+        if len(agent_names) < 2:
+            return [load(name) for name in agent_names]
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(agent_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load, agent_names))
+    
+    def iter_agents(self, agent_names: Iterable[str]) -> Iterator[Optional[Dict[str, Any]]]:
+        """Load agent configurations concurrently and yield them in order, holding only a few at once"""
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for agent_name in agent_names:
+                pending.append(executor.submit(self.load_agent, agent_name, False))
+                # Stay a bounded number of loads ahead of the consumer
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
     
     def list_agents(self) -> List[str]:
         """List all configured agents"""
+        # Adding, removing or renaming a file bumps the directory mtime
+        dir_mtime = self.config_dir.stat().st_mtime_ns
+        if self._list_cache and self._list_cache[0] == dir_mtime:
+            return list(self._list_cache[1])
+        
         agents = []
         for config_file in self.config_dir.glob("*.yaml"):
             agents.append(config_file.stem)
-        return sorted(agents)
+        agents.sort()
+        self._list_cache = (dir_mtime, agents)
+        return list(agents)
     
     def delete_agent(self, agent_name: str) -> bool:
         """Delete agent configuration"""
@@ -177,6 +322,9 @@ class AgentConfig:
             return False
         
         try:
+            with self._cache_lock:
+                self._cache.pop(config_file, None)
+                self._list_cache = None
             config_file.unlink()
             print_success(f"Deleted: {agent_name}")
             return True
@@ -184,38 +332,59 @@ class AgentConfig:
             print_error(f"Failed to delete agent: {e}")
             return False
     
-    def export_agents(self, output_file: str = None) -> bool:
+    def export_agents(self, output_file: str = None, ndjson: bool = False) -> bool:
         """Export all agent configurations"""
-        agents = {}
-        
-        for agent_name in self.list_agents():
-            config = self.load_agent(agent_name)
-            if config:
-                agents[agent_name] = config
-        
-        if not agents:
+        exported_at = datetime.now().isoformat()
+        agent_names = self.list_agents()
+        agents = (
+            (agent_name, config)
+            for agent_name, config in zip(agent_names, self.iter_agents(agent_names))
+            if config
+        )
+        
+        first = next(agents, None)
+        if first is None:
             print_warning("No agents to export")
             return False
-        
-        output = {
-            'exported_at': datetime.now().isoformat(),
-            'count': len(agents),
-            'agents': agents
-        }
+        agents = itertools.chain([first], agents)
         
         if output_file:
             try:
-                with open(output_file, 'w') as f:
-                    json.dump(output, f, indent=2)
-                print_success(f"Exported {len(agents)} agents to {output_file}")
+                with open(output_file, 'wb') as f:
+                    count = self._write_export(f, agents, exported_at, ndjson)
+                print_success(f"Exported {count} agents to {output_file}")
                 return True
             except Exception as e:
                 print_error(f"Failed to export: {e}")
                 return False
         else:
-            print(json.dumps(output, indent=2))
+            sys.stdout.flush()
+            self._write_export(sys.stdout.buffer, agents, exported_at, ndjson)
+            sys.stdout.buffer.flush()
             return True
     
+    def _write_export(self, f, agents: Iterable[Tuple[str, Dict[str, Any]]], exported_at: str, ndjson: bool) -> int:
+        """Stream (name, config) pairs to binary file f one agent at a time, returning the count"""
+        count = 0
+        
+        if ndjson:
+            for agent_name, config in agents:
+                f.write(json_dumps({'name': agent_name, 'config': config}))
+                f.write(b'\n')
+                count += 1
+            return count
+        
+        # Same envelope as before, with 'count' trailing since it is only known at the end
+        f.write(b'{"exported_at": %s, "agents": {' % json_dumps(exported_at))
+        for agent_name, config in agents:
+            f.write(b',\n' if count else b'\n')
+            f.write(json_dumps(agent_name))
+            f.write(b': ')
+            f.write(json_dumps(config))
+            count += 1
+        f.write(b'\n}, "count": %d}\n' % count)
+        return count
+    
     def import_agents(self, input_file: str) -> bool:
         """Import agent configurations"""
         input_path = Path(input_file)
@@ -225,8 +394,18 @@ class AgentConfig:
             return False
         
         try:
-            with open(input_path, 'r') as f:
-                data = json.load(f)
+            raw = input_path.read_bytes()
+            try:
+                data = json_loads(raw)
+            except ValueError:
+                # Several documents: one {"name", "config"} object per line (export --ndjson)
+                data = [json_loads(line) for line in raw.splitlines() if line.strip()]
+            else:
+                if isinstance(data, dict) and 'agents' not in data and 'name' in data and 'config' in data:
+                    data = [data]  # NDJSON export of a single agent
+            
+            if isinstance(data, list):
+                data = {'agents': {record['name']: record['config'] for record in data}}
             
             if 'agents' not in data:
                 print_error("Invalid import file format")
@@ -272,7 +451,7 @@ class AgentConfig:
         
         doc.append("\n## Configuration\n")
         doc.append("```yaml")
-        doc.append(yaml.dump(config.get('configuration', {}), default_flow_style=False))
+        doc.append(yaml.dump(config.get('configuration', {}), Dumper=Dumper, default_flow_style=False))
         doc.append("```")
         
         if config.get('interfaces'):
@@ -321,8 +500,7 @@ class AgentConfigCLI:
         
         print(f"\n{Colors.BOLD}Configured Agents ({len(agents)}){Colors.END}\n")
         
-        for agent_name in agents:
-            config = self.agent_config.load_agent(agent_name)
+        for config in self.agent_config.load_agents(agents, header_only=True):
             if config:
                 print(f"  {Colors.GREEN}•{Colors.END} {config['name']}")
                 print(f"    Type: {config.get('type', 'unknown')}")
@@ -371,7 +549,7 @@ class AgentConfigCLI:
     
     def cmd_export(self, args) -> int:
         """Export configurations"""
-        return 0 if self.agent_config.export_agents(args.output) else 1
+        return 0 if self.agent_config.export_agents(args.output, ndjson=args.ndjson) else 1
     
     def cmd_import(self, args) -> int:
         """Import configurations"""
@@ -384,7 +562,7 @@ class AgentConfigCLI:
             return 1
         
         print()
-        print(json.dumps(config, indent=2))
+        write_stdout(json_dumps(config, indent=True) + b'\n')
         print()
         return 0
     
@@ -419,53 +597,58 @@ Examples:
   # Export configurations
   python3 agent_config.py export --output agents.json
   
+  # Export as newline-delimited JSON
+  python3 agent_config.py export --ndjson --output agents.ndjson
+  
   # Generate documentation
   python3 agent_config.py docs my-agent
         '''
     )
     
+    cli = AgentConfigCLI()
     subparsers = parser.add_subparsers(dest='command', help='Command to run')
     
     # init command
     init_parser = subparsers.add_parser('init', help='Initialize new agent')
     init_parser.add_argument('name', help='Agent name')
-    init_parser.set_defaults(func=AgentConfigCLI().cmd_init)
+    init_parser.set_defaults(func=cli.cmd_init)
     
     # list command
     list_parser = subparsers.add_parser('list', help='List all agents')
-    list_parser.set_defaults(func=AgentConfigCLI().cmd_list)
+    list_parser.set_defaults(func=cli.cmd_list)
     
     # create command
     create_parser = subparsers.add_parser('create', help='Create agent')
     create_parser.add_argument('name', help='Agent name')
     create_parser.add_argument('--type', help='Agent type')
     create_parser.add_argument('--description', help='Agent description')
-    create_parser.set_defaults(func=AgentConfigCLI().cmd_create)
+    create_parser.set_defaults(func=cli.cmd_create)
     
     # validate command
     validate_parser = subparsers.add_parser('validate', help='Validate agent')
     validate_parser.add_argument('name', help='Agent name')
-    validate_parser.set_defaults(func=AgentConfigCLI().cmd_validate)
+    validate_parser.set_defaults(func=cli.cmd_validate)
     
     # export command
     export_parser = subparsers.add_parser('export', help='Export configurations')
     export_parser.add_argument('--output', help='Output file')
-    export_parser.set_defaults(func=AgentConfigCLI().cmd_export)
+    export_parser.add_argument('--ndjson', action='store_true', help='Write one JSON object per agent per line')
+    export_parser.set_defaults(func=cli.cmd_export)
     
     # import command
     import_parser = subparsers.add_parser('import', help='Import configurations')
     import_parser.add_argument('input', help='Input file')
-    import_parser.set_defaults(func=AgentConfigCLI().cmd_import)
+    import_parser.set_defaults(func=cli.cmd_import)
     
     # info command
     info_parser = subparsers.add_parser('info', help='Show agent info')
     info_parser.add_argument('name', help='Agent name')
-    info_parser.set_defaults(func=AgentConfigCLI().cmd_info)
+    info_parser.set_defaults(func=cli.cmd_info)
     
     # docs command
     docs_parser = subparsers.add_parser('docs', help='Generate documentation')
     docs_parser.add_argument('name', help='Agent name')
-    docs_parser.set_defaults(func=AgentConfigCLI().cmd_docs)
+    docs_parser.set_defaults(func=cli.cmd_docs)
     
     args = parser.parse_args()
     
@@ -14,16 +14,57 @@ Features:
 - Exports in multiple formats
 """
 
+import io
 import os
+import mmap
+import codecs
 import re
 import sys
 import json
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HEADING_RE = re.compile(rb'^(#+)\s+(.+)$', re.MULTILINE)
+WHITESPACE_RE = re.compile(r'\s+')
+NON_ANCHOR_RE = re.compile(r'[^\w\-]')
+
+# Deletes every ASCII character NON_ANCHOR_RE would strip
+ANCHOR_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) in '_-')
+))
+
+# Directory name -> category, checked in priority order
+CATEGORY_MAP = (
+    ('guides', 'Guides'),
+    ('resources', 'Resources'),
+    ('architecture', 'Architecture'),
+    ('api', 'API'),
+    ('operations', 'Operations'),
+    ('docs', 'Documentation'),
+)
+
+# Bytes decoded at a time when counting lines and words
+READ_CHUNK_SIZE = 1 << 20
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 32
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 class Colors:
     RED = '\033[91m'
     GREEN = '\033[92m'
@@ -44,6 +85,109 @@ def print_error(msg: str) -> None:
     """Print error message"""
     print(f"{Colors.RED}✗{Colors.END} {msg}")
 
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """Yield markdown files under root, walking with os.scandir"""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            print_error(f"Cannot scan directory: {e}")
+
+def count_lines_and_words(data) -> Tuple[int, int]:
+    """Count lines and words of UTF-8 content one chunk at a time"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    line_count = 1
+    word_count = 0
+    in_word = False
+    
+    for start in range(0, len(data), READ_CHUNK_SIZE):
+        text = decoder.decode(data[start:start + READ_CHUNK_SIZE])
+        if not text:
+            continue
+        
+        line_count += text.count('\n')
+        word_count += len(text.split())
+        # A word split across two chunks was counted twice
+        if in_word and not text[0].isspace():
+            word_count -= 1
+        in_word = not text[-1].isspace()
+    
+    decoder.decode(b'', final=True)
+    return line_count, word_count
+
+def analyze_file(file_path: Path, docs_root: Path) -> Optional[Dict[str, Any]]:
+    """Analyze individual file"""
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # mmap cannot map an empty file
+                line_count, word_count, sections = 1, 0, []
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = mm
+                    
+                    # Match read_text()'s universal newline handling
+                    if mm.find(b'\r') != -1:
+                        content = mm[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                    
+                    # Calculate metrics
+                    line_count, word_count = count_lines_and_words(content)
+                    
+                    # Extract sections
+                    sections = extract_sections(content, file_path.name)
+    except Exception as e:
+        print_error(f"Cannot read {file_path}: {e}")
+        return None
+    
+    return {
+        'name': file_path.name,
+        'path': str(file_path.relative_to(docs_root)),
+        'category': categorize_file(file_path),
+        'lines': line_count,
+        'words': word_count,
+        'size': size,
+        'sections': len(sections),
+        'headings': sections
+    }
+
+def extract_sections(data, file_name: str) -> List[Tuple[str, int, str]]:
+    """Extract (file, level, text) section headings from raw content"""
+    return [
+        (file_name, len(match.group(1)), match.group(2).decode('utf-8'))
+        for match in HEADING_RE.finditer(data)
+    ]
+
+def expand_sections(sections: List[Tuple[str, int, str]]) -> List[Dict]:
+    """Expand section tuples into dicts, computing anchors"""
+    return [
+        {'file': file_name, 'level': level, 'text': text, 'anchor': text_to_anchor(text)}
+        for file_name, level, text in sections
+    ]
+
+def text_to_anchor(text: str) -> str:
+    """Convert heading text to anchor"""
+    anchor = text.lower()
+    anchor = WHITESPACE_RE.sub('-', anchor)
+    if anchor.isascii():
+        return anchor.translate(ANCHOR_DELETE_TABLE)
+    return NON_ANCHOR_RE.sub('', anchor)
+
+def categorize_file(file_path: Path) -> str:
+    """Categorize file by directory"""
+    parts = set(file_path.parts)
+    
+    for directory, category in CATEGORY_MAP:
+        if directory in parts:
+            return category
+    return 'Other'
+
 class DocumentationAnalyzer:
     """Analyzes documentation structure and content"""
     
@@ -57,10 +201,16 @@ class DocumentationAnalyzer:
             'total_size': 0,
             'files': [],
             'categories': {},
-            'sections': [],
             'generated_at': datetime.now().isoformat()
         }
+        # Per-category running totals, copied into stats['categories'] after analysis
+        self._categories = defaultdict(lambda: {'count': 0, 'lines': 0, 'words': 0, 'size': 0})
         
+    @property
+    def all_sections(self) -> List[Tuple[str, int, str]]:
+        """All (file, level, text) headings across analyzed files"""
+        return [heading for file_info in self.stats['files'] for heading in file_info['headings']]
+    
     def analyze(self) -> Dict[str, Any]:
         """Analyze documentation"""
         if not self.docs_path.exists():
@@ -70,7 +220,7 @@ class DocumentationAnalyzer:
         print_info(f"Analyzing: {self.docs_path}")
         
         # Get all markdown files
-        md_files = sorted(self.docs_path.rglob('*.md'))
+        md_files = sorted(iter_markdown_files(self.docs_path))
         
         if not md_files:
             print_error("No markdown files found")
@@ -78,9 +228,18 @@ class DocumentationAnalyzer:
         
         print_info(f"Found {len(md_files)} markdown files")
         
-        # Analyze each file
-        for file_path in md_files:
-            self._analyze_file(file_path)
+        # Analyze each file, spreading large trees across processes
+        analyze = partial(analyze_file, docs_root=self.docs_path.parent)
+        if len(md_files) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(analyze, md_files, chunksize=16))
+        else:
+            results = [analyze(file_path) for file_path in md_files]
+        
+        for file_info in results:
+            if file_info:
+                self._record_file(file_info)
+        self.stats['categories'] = dict(self._categories)
         
         # Calculate totals
         self._calculate_totals()
@@ -88,98 +247,16 @@ class DocumentationAnalyzer:
         print_success("Analysis complete")
         return self.stats
     
-    def _analyze_file(self, file_path: Path) -> None:
-        """Analyze individual file"""
-        try:
-            content = file_path.read_text(encoding='utf-8')
-        except Exception as e:
-            print_error(f"Cannot read {file_path}: {e}")
-            return
-        
-        # Calculate metrics
-        lines = content.split('\n')
-        words = content.split()
-        size = len(content.encode('utf-8'))
-        
-        # Extract sections
-        sections = self._extract_sections(content, file_path)
-        
-        # Categorize file
-        category = self._categorize_file(file_path)
-        
-        file_info = {
-            'name': file_path.name,
-            'path': str(file_path.relative_to(self.docs_path.parent)),
-            'category': category,
-            'lines': len(lines),
-            'words': len(words),
-            'size': size,
-            'sections': len(sections),
-            'headings': sections
-        }
-        
+    def _record_file(self, file_info: Dict[str, Any]) -> None:
+        """Merge one analyzed file into the statistics"""
         self.stats['files'].append(file_info)
         
         # Add to category stats
-        if category not in self.stats['categories']:
-            self.stats['categories'][category] = {
-                'count': 0,
-                'lines': 0,
-                'words': 0,
-                'size': 0
-            }
-        
-        self.stats['categories'][category]['count'] += 1
-        self.stats['categories'][category]['lines'] += len(lines)
-        self.stats['categories'][category]['words'] += len(words)
-        self.stats['categories'][category]['size'] += size
-        
-        # Add sections
-        self.stats['sections'].extend(sections)
-    
-    def _extract_sections(self, content: str, file_path: Path) -> List[Dict]:
-        """Extract section headings from content"""
-        sections = []
-        heading_regex = re.compile(r'^(#+)\s+(.+)$', re.MULTILINE)
-        
-        for match in heading_regex.finditer(content):
-            level = len(match.group(1))
-            text = match.group(2)
-            
-            sections.append({
-                'file': file_path.name,
-                'level': level,
-                'text': text,
-                'anchor': self._text_to_anchor(text)
-            })
-        
-        return sections
-    
-    def _text_to_anchor(self, text: str) -> str:
-        """Convert heading text to anchor"""
-        anchor = text.lower()
-        anchor = re.sub(r'\s+', '-', anchor)
-        anchor = re.sub(r'[^\w\-]', '', anchor)
-        return anchor
-    
-    def _categorize_file(self, file_path: Path) -> str:
-        """Categorize file by directory"""
-        parts = file_path.parts
-        
-        if 'guides' in parts:
-            return 'Guides'
-        elif 'resources' in parts:
-            return 'Resources'
-        elif 'architecture' in parts:
-            return 'Architecture'
-        elif 'api' in parts:
-            return 'API'
-        elif 'operations' in parts:
-            return 'Operations'
-        elif 'docs' in parts:
-            return 'Documentation'
-        else:
-            return 'Other'
+        category_stats = self._categories[file_info['category']]
+        category_stats['count'] += 1
+        category_stats['lines'] += file_info['lines']
+        category_stats['words'] += file_info['words']
+        category_stats['size'] += file_info['size']
     
     def _calculate_totals(self) -> None:
         """Calculate total statistics"""
@@ -192,6 +269,10 @@ class DocumentationAnalyzer:
             total_words += file_info['words']
             total_size += file_info['size']
         
+        # Sort once here so every output format can iterate in order
+        self.stats['files'].sort(key=lambda x: x['name'])
+        self.stats['categories'] = dict(sorted(self.stats['categories'].items()))
+        
         self.stats['total_files'] = len(self.stats['files'])
         self.stats['total_lines'] = total_lines
         self.stats['total_words'] = total_words
@@ -207,87 +288,100 @@ class DocumentationAnalyzer:
     
     def get_summary_text(self) -> str:
         """Generate text summary"""
-        summary = []
-        summary.append("="*70)
-        summary.append(f"{'Documentation Summary':^70}")
-        summary.append("="*70)
-        summary.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w("="*70 + "\n")
+        w(f"{'Documentation Summary':^70}\n")
+        w("="*70 + "\n")
+        w("\n")
         
         # Overall statistics
-        summary.append("OVERALL STATISTICS")
-        summary.append(f"  Total Files:    {self.stats['total_files']}")
-        summary.append(f"  Total Lines:    {self.stats['total_lines']:,}")
-        summary.append(f"  Total Words:    {self.stats['total_words']:,}")
-        summary.append(f"  Total Size:     {self.get_size_display(self.stats['total_size'])}")
-        summary.append("")
+        w("OVERALL STATISTICS\n")
+        w(f"  Total Files:    {self.stats['total_files']}\n")
+        w(f"  Total Lines:    {self.stats['total_lines']:,}\n")
+        w(f"  Total Words:    {self.stats['total_words']:,}\n")
+        w(f"  Total Size:     {self.get_size_display(self.stats['total_size'])}\n")
+        w("\n")
         
         # By category
-        summary.append("BY CATEGORY")
-        for category, stats in sorted(self.stats['categories'].items()):
-            summary.append(f"\n  {category}:")
-            summary.append(f"    Files:  {stats['count']}")
-            summary.append(f"    Lines:  {stats['lines']:,}")
-            summary.append(f"    Words:  {stats['words']:,}")
-            summary.append(f"    Size:   {self.get_size_display(stats['size'])}")
-        
-        summary.append("")
-        summary.append("FILES")
-        for file_info in sorted(self.stats['files'], key=lambda x: x['name']):
-            summary.append(f"\n  {file_info['name']}")
-            summary.append(f"    Path:     {file_info['path']}")
-            summary.append(f"    Category: {file_info['category']}")
-            summary.append(f"    Lines:    {file_info['lines']}")
-            summary.append(f"    Words:    {file_info['words']}")
-            summary.append(f"    Sections: {file_info['sections']}")
-        
-        summary.append("")
-        summary.append("="*70)
-        summary.append(f"Generated: {self.stats['generated_at']}")
-        summary.append("="*70)
-        
-        return "\n".join(summary)
+        w("BY CATEGORY\n")
+        for category, stats in self.stats['categories'].items():
+            w(f"\n  {category}:\n")
+            w(f"    Files:  {stats['count']}\n")
+            w(f"    Lines:  {stats['lines']:,}\n")
+            w(f"    Words:  {stats['words']:,}\n")
+            w(f"    Size:   {self.get_size_display(stats['size'])}\n")
+        
+        w("\n")
+        w("FILES\n")
+        for file_info in self.stats['files']:
+            w(f"\n  {file_info['name']}\n")
+            w(f"    Path:     {file_info['path']}\n")
+            w(f"    Category: {file_info['category']}\n")
+            w(f"    Lines:    {file_info['lines']}\n")
+            w(f"    Words:    {file_info['words']}\n")
+            w(f"    Sections: {file_info['sections']}\n")
+        
+        w("\n")
+        w("="*70 + "\n")
+        w(f"Generated: {self.stats['generated_at']}\n")
+        w("="*70 + "\n")
+        
+        # Omit the final newline; print() adds one
+        return buf.getvalue()[:-1]
     
     def get_summary_markdown(self) -> str:
         """Generate markdown summary"""
-        md = []
-        md.append("# Documentation Summary\n")
-        md.append(f"*Generated: {self.stats['generated_at']}*\n")
+        buf = io.StringIO()
+        w = buf.write
+        w("# Documentation Summary\n\n")
+        w(f"*Generated: {self.stats['generated_at']}*\n\n")
         
         # Overview
-        md.append("## Overview\n")
-        md.append(f"- **Total Files:** {self.stats['total_files']}")
-        md.append(f"- **Total Lines:** {self.stats['total_lines']:,}")
-        md.append(f"- **Total Words:** {self.stats['total_words']:,}")
-        md.append(f"- **Total Size:** {self.get_size_display(self.stats['total_size'])}\n")
+        w("## Overview\n\n")
+        w(f"- **Total Files:** {self.stats['total_files']}\n")
+        w(f"- **Total Lines:** {self.stats['total_lines']:,}\n")
+        w(f"- **Total Words:** {self.stats['total_words']:,}\n")
+        w(f"- **Total Size:** {self.get_size_display(self.stats['total_size'])}\n\n")
         
         # By category
-        md.append("## By Category\n")
-        md.append("| Category | Files | Lines | Words | Size |")
-        md.append("|----------|-------|-------|-------|------|")
+        w("## By Category\n\n")
+        w("| Category | Files | Lines | Words | Size |\n")
+        w("|----------|-------|-------|-------|------|\n")
         
-        for category, stats in sorted(self.stats['categories'].items()):
-            md.append(
+        for category, stats in self.stats['categories'].items():
+            w(
                 f"| {category} | {stats['count']} | {stats['lines']:,} | "
-                f"{stats['words']:,} | {self.get_size_display(stats['size'])} |"
+                f"{stats['words']:,} | {self.get_size_display(stats['size'])} |\n"
             )
         
-        md.append("")
-        md.append("## Files\n")
-        
-        for file_info in sorted(self.stats['files'], key=lambda x: x['name']):
-            md.append(f"### {file_info['name']}\n")
-            md.append(f"- **Path:** {file_info['path']}")
-            md.append(f"- **Category:** {file_info['category']}")
-            md.append(f"- **Lines:** {file_info['lines']}")
-            md.append(f"- **Words:** {file_info['words']}")
-            md.append(f"- **Sections:** {file_info['sections']}\n")
+        w("\n")
+        w("## Files\n\n")
         
-        return "\n".join(md)
+        for file_info in self.stats['files']:
+            w(f"### {file_info['name']}\n\n")
+            w(f"- **Path:** {file_info['path']}\n")
+            w(f"- **Category:** {file_info['category']}\n")
+            w(f"- **Lines:** {file_info['lines']}\n")
+            w(f"- **Words:** {file_info['words']}\n")
+            w(f"- **Sections:** {file_info['sections']}\n\n")
+        
+        # Omit the final newline; print() adds one
+        return buf.getvalue()[:-1]
+    
+    def get_export_stats(self) -> Dict[str, Any]:
+        """Return statistics with headings expanded for JSON export"""
+        stats = dict(self.stats)
+        stats['files'] = [
+            dict(file_info, headings=expand_sections(file_info['headings']))
+            for file_info in self.stats['files']
+        ]
+        return stats
     
     def export_json(self, output_path: str) -> None:
         """Export statistics as JSON"""
-        with open(output_path, 'w') as f:
-            json.dump(self.stats, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(json_dumps(self.get_export_stats()))
         print_success(f"Exported to: {output_path}")
     
     def print_summary(self) -> None:
@@ -330,14 +424,15 @@ Examples:
     analyzer = DocumentationAnalyzer(args.path)
     
     # Analyze documentation
-    stats = analyzer.analyze()
+    analyzer.analyze()
     
     # Output results
     if args.format == 'json':
         if args.output:
             analyzer.export_json(args.output)
         else:
-            print(json.dumps(stats, indent=2))
+            sys.stdout.flush()
+            sys.stdout.buffer.write(json_dumps(analyzer.get_export_stats()) + b'\n')
     elif args.format == 'md':
         print(analyzer.get_summary_markdown())
     else:  # txt
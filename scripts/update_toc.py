@@ -15,19 +15,39 @@ Features:
 - Can write in-place or to stdout
 """
 
+import os
 import sys
 import re
+import mmap
+import shutil
 import argparse
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Final, List, Tuple, Optional, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+ANCHOR_STRIP_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RE = re.compile(r'\s')
+
+# ASCII equivalent of ANCHOR_STRIP_RE plus the whitespace-to-hyphen step, for str.translate
+ANCHOR_TABLE: Dict[int, Optional[str]] = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) in '_-')
+}
+ANCHOR_TABLE.update((i, '-') for i in range(128) if chr(i).isspace())
+
+# Directories never worth descending into when looking for docs
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'})
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 32
 
 class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    RED: Final = '\033[91m'
+    GREEN: Final = '\033[92m'
+    YELLOW: Final = '\033[93m'
+    BLUE: Final = '\033[94m'
+    BOLD: Final = '\033[1m'
+    END: Final = '\033[0m'
 
 def print_info(msg: str) -> None:
     """Print info message"""
@@ -45,24 +65,94 @@ def print_error(msg: str) -> None:
     """Print error message"""
     print(f"{Colors.RED}✗{Colors.END} {msg}", file=sys.stderr)
 
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """Yield markdown files under root, skipping SKIP_DIRS"""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            print_error(f"Cannot scan directory: {e}")
+
+LOG_PREFIXES = {
+    'info': f"{Colors.BLUE}ℹ{Colors.END}",
+    'success': f"{Colors.GREEN}✓{Colors.END}",
+    'warning': f"{Colors.YELLOW}⚠{Colors.END}",
+    'error': f"{Colors.RED}✗{Colors.END}",
+}
+
+# Levels hidden by --quiet; warnings and errors are always shown
+QUIET_LEVELS = frozenset({'info', 'success'})
+
+def emit_log(log: List[Tuple[str, str]], quiet: bool = False) -> None:
+    """Write (level, message) pairs collected for one file to stderr in a single call"""
+    lines = [
+        f"{LOG_PREFIXES[level]} {msg}\n" for level, msg in log
+        if not (quiet and level in QUIET_LEVELS)
+    ]
+    if lines:
+        sys.stderr.write(''.join(lines))
+
 class TableOfContentsGenerator:
     """Generates and updates table of contents for markdown files"""
     
-    def __init__(self, max_depth: int = 3, in_place: bool = False):
+    def __init__(self, max_depth: int = 3, in_place: bool = False, quiet: bool = False):
         """Initialize generator"""
         self.max_depth = max_depth
         self.in_place = in_place
+        self.quiet = quiet
         self.toc_marker = '<!-- toc -->'
         self.toc_end_marker = '<!-- tocend -->'
-        self.heading_regex = re.compile(r'^(#+)\s+(.+)$', re.MULTILINE)
     
-    def extract_headings(self, content: str) -> List[Tuple[int, str]]:
-        """Extract headings from markdown content"""
+    def extract_headings(self, content: str) -> Tuple[List[Tuple[int, str]], Optional[int]]:
+        """Extract headings from markdown content, plus the end offset of the first heading line"""
         headings = []
+        first_heading_end = None
+        fence = None
+        line_end = -1
         
-        for match in self.heading_regex.finditer(content):
-            level = len(match.group(1))
-            text = match.group(2)
+        for line in content.split('\n'):
+            line_start = line_end + 1
+            line_end = line_start + len(line)
+            
+            # Skip fenced code blocks; a fence closes only on a line of at
+            # least as many of the same character and nothing else.
+            # Fences indented 4+ columns are indented code, not fences.
+            if fence is not None:
+                stripped = line.lstrip()
+                if (stripped.startswith(fence) and not stripped.strip().strip(fence[0])
+                        and len(line[:len(line) - len(stripped)].expandtabs(4)) < 4):
+                    fence = None
+                continue
+            
+            if not line.startswith('#'):
+                stripped = line.lstrip()
+                if (stripped.startswith(('```', '~~~'))
+                        and len(line[:len(line) - len(stripped)].expandtabs(4)) < 4):
+                    marker = stripped[:len(stripped) - len(stripped.lstrip(stripped[0]))]
+                    # A backtick info string cannot contain backticks, so
+                    # "```x``` inline" is an inline code span, not a fence
+                    if marker[0] != '`' or '`' not in stripped[len(marker):]:
+                        fence = marker
+                continue
+            
+            text = line.lstrip('#')
+            level = len(line) - len(text)
+            if not text[:1].isspace():
+                continue  # '#tag', not a heading
+            text = text.lstrip()
+            if not text:
+                continue
+            
+            # The TOC is inserted after the first heading of any level
+            if first_heading_end is None:
+                first_heading_end = line_end
             
             # Skip H1 (usually document title)
             if level == 1:
@@ -74,19 +164,18 @@ class TableOfContentsGenerator:
             
             headings.append((level, text))
         
-        return headings
+        return headings, first_heading_end
     
     def text_to_anchor(self, text: str) -> str:
         """Convert heading text to markdown anchor format"""
-        # Remove markdown formatting
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*(.+?)\*', r'\1', text)       # Italic
-        text = re.sub(r'`(.+?)`', r'\1', text)         # Code
-        
-        # Convert to anchor
+        # Bold, italic and code markers ('*', '`') are special characters,
+        # so stripping them below also removes the markdown formatting
         anchor = text.lower()
-        anchor = re.sub(r'\s+', '-', anchor)           # Spaces to hyphens
-        anchor = re.sub(r'[^\w\-]', '', anchor)        # Remove special chars
+        if anchor.isascii():
+            return anchor.translate(ANCHOR_TABLE)  # Strip special chars, whitespace to hyphens
+        
+        anchor = ANCHOR_STRIP_RE.sub('', anchor)  # Remove special chars
+        anchor = WHITESPACE_RE.sub('-', anchor)   # Each whitespace char to a hyphen
         
         return anchor
     
@@ -97,25 +186,31 @@ class TableOfContentsGenerator:
         
         toc_lines = ["## Table of Contents\n"]
         
+        # Indentation per heading level; H2 is the top level of the TOC
+        max_level = max(level for level, _ in headings)
+        indents = ["  " * (level - 2) for level in range(max_level + 1)]
+        
         for level, text in headings:
-            # Calculate indentation
-            indent = "  " * (level - 2)
             anchor = self.text_to_anchor(text)
-            toc_lines.append(f"{indent}- [{text}](#{anchor})")
+            toc_lines.append(''.join((indents[level], '- [', text, '](#', anchor, ')')))
         
         return "\n".join(toc_lines) + "\n"
     
     def extract_toc_section(self, content: str) -> Optional[Tuple[int, int]]:
         """Find existing TOC section in content"""
-        start_match = re.search(re.escape(self.toc_marker), content)
-        end_match = re.search(re.escape(self.toc_end_marker), content)
+        # Markers are literal strings, so a plain substring search is enough
+        start = content.find(self.toc_marker)
+        if start < 0:
+            return None
         
-        if start_match and end_match:
-            return (start_match.start(), end_match.end())
+        end = content.find(self.toc_end_marker, start + len(self.toc_marker))
+        if end < 0:
+            return None
         
-        return None
+        return (start, end + len(self.toc_end_marker))
     
-    def update_content_with_toc(self, content: str, toc: str) -> str:
+    def update_content_with_toc(self, content: str, toc: str,
+                                first_heading_end: Optional[int] = None) -> str:
         """Update content with new TOC"""
         toc_section = self.extract_toc_section(content)
         
@@ -130,12 +225,12 @@ class TableOfContentsGenerator:
                 content[end:]
             )
         else:
-            # Insert TOC after first heading
-            heading_match = self.heading_regex.search(content)
-            if heading_match:
-                insert_pos = heading_match.end()
+            # Insert TOC after first heading, found here if the caller has not already
+            if first_heading_end is None:
+                first_heading_end = self.extract_headings(content)[1]
+            if first_heading_end is not None:
                 # Find end of line
-                insert_pos = content.find('\n', insert_pos) + 1
+                insert_pos = content.find('\n', first_heading_end) + 1
                 new_content = (
                     content[:insert_pos] + "\n" +
                     self.toc_marker + "\n\n" +
@@ -149,50 +244,88 @@ class TableOfContentsGenerator:
         
         return new_content
     
+    def read_if_has_headings(self, file_path: Path) -> Optional[str]:
+        """Read file content, or return None without decoding if no line starts with '#'"""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None  # mmap cannot map an empty file
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:1] != b'#' and mm.find(b'\n#') < 0 and mm.find(b'\r#') < 0:
+                    return None
+                content = mm[:].decode('utf-8')
+        
+        # Match read_text()'s universal newline handling
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def process_file(self, file_path: Path) -> bool:
         """Process single markdown file"""
+        success, log, output = self.run_file(file_path)
+        emit_log(log, self.quiet)
+        if output is not None:
+            print(output)
+        return success
+    
+    def run_file(self, file_path: Path) -> Tuple[bool, List[Tuple[str, str]], Optional[str]]:
+        """Process single markdown file, returning (success, log messages, stdout output)"""
+        log = []
+        
         if not file_path.exists():
-            print_error(f"File not found: {file_path}")
-            return False
+            log.append(('error', f"File not found: {file_path}"))
+            return False, log, None
         
         if file_path.suffix != '.md':
-            print_warning(f"Not a markdown file: {file_path}")
-            return False
+            log.append(('warning', f"Not a markdown file: {file_path}"))
+            return False, log, None
         
-        print_info(f"Processing: {file_path.name}")
+        log.append(('info', f"Processing: {file_path.name}"))
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            content = self.read_if_has_headings(file_path)
         except Exception as e:
-            print_error(f"Cannot read file: {e}")
-            return False
+            log.append(('error', f"Cannot read file: {e}"))
+            return False, log, None
+        
+        if content is None:
+            log.append(('warning', f"No headings found in {file_path.name}"))
+            return False, log, None
         
         # Extract headings
-        headings = self.extract_headings(content)
+        headings, first_heading_end = self.extract_headings(content)
         
         if not headings:
-            print_warning(f"No headings found in {file_path.name}")
-            return False
+            log.append(('warning', f"No headings found in {file_path.name}"))
+            return False, log, None
         
         # Generate TOC
         toc = self.generate_toc(headings)
         
         # Update content
-        new_content = self.update_content_with_toc(content, toc)
+        new_content = self.update_content_with_toc(content, toc, first_heading_end)
         
         if self.in_place:
-            # Write back to file
+            # Leave up-to-date files (and their mtimes) untouched
+            if new_content == content:
+                log.append(('info', f"Up-to-date: {file_path.name}"))
+                return True, log, None
+            
+            # Write back via a temp file so a crash never leaves a partial file
+            tmp_path = file_path.with_suffix('.md.tmp')
             try:
-                file_path.write_text(new_content, encoding='utf-8')
-                print_success(f"Updated: {file_path.name} ({len(headings)} headings)")
-                return True
+                tmp_path.write_text(new_content, encoding='utf-8')
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+                log.append(('success', f"Updated: {file_path.name} ({len(headings)} headings)"))
+                return True, log, None
             except Exception as e:
-                print_error(f"Cannot write file: {e}")
-                return False
+                tmp_path.unlink(missing_ok=True)
+                log.append(('error', f"Cannot write file: {e}"))
+                return False, log, None
         else:
             # Print to stdout
-            print(new_content)
-            return True
+            return True, log, new_content
     
     def process_directory(self, dir_path: Path) -> Tuple[int, int]:
         """Process all markdown files in directory"""
@@ -200,19 +333,32 @@ class TableOfContentsGenerator:
             print_error(f"Not a directory: {dir_path}")
             return (0, 0)
         
-        md_files = sorted(dir_path.rglob('*.md'))
+        md_files = sorted(iter_markdown_files(dir_path))
         
         if not md_files:
             print_warning("No markdown files found")
             return (0, 0)
         
-        print_info(f"Found {len(md_files)} markdown files")
+        if not self.quiet:
+            print_info(f"Found {len(md_files)} markdown files")
         
         success_count = 0
         error_count = 0
         
-        for file_path in md_files:
-            if self.process_file(file_path):
+        # Spread large trees across processes; results come back in file order
+        results: Iterable[Tuple[bool, List[Tuple[str, str]], Optional[str]]]
+        if len(md_files) >= PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(self.run_file, md_files, chunksize=8))
+        else:
+            results = map(self.run_file, md_files)
+        
+        for success, log, output in results:
+            emit_log(log, self.quiet)
+            if output is not None:
+                print(output)
+            
+            if success:
                 success_count += 1
             else:
                 error_count += 1
@@ -237,6 +383,9 @@ Examples:
   
   # Generate TOC with max depth of 2
   python3 update_toc.py docs/ --in-place --max-depth 2
+  
+  # Only report warnings and errors
+  python3 update_toc.py docs/ --in-place --quiet
         '''
     )
     
@@ -258,12 +407,19 @@ Examples:
         help='Maximum heading depth to include in TOC (default: 3)'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only report warnings and errors'
+    )
+    
     args = parser.parse_args()
     
     # Create generator
     generator = TableOfContentsGenerator(
         max_depth=args.max_depth,
-        in_place=args.in_place
+        in_place=args.in_place,
+        quiet=args.quiet
     )
     
     path = Path(args.path)
@@ -276,8 +432,9 @@ Examples:
         # Process directory
         success_count, error_count = generator.process_directory(path)
         
-        print_info(f"\n{'='*50}")
-        print_success(f"Successfully updated: {success_count} files")
+        if not args.quiet:
+            print_info(f"\n{'='*50}")
+            print_success(f"Successfully updated: {success_count} files")
         if error_count > 0:
             print_error(f"Failed: {error_count} files")
         
@@ -23,20 +23,57 @@ Exit codes:
 import os
 import re
 import sys
+import json
+import mmap
+import time
 import argparse
-import requests
+import threading
+import urllib3
+from urllib3.util.retry import Retry
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
-from urllib.parse import urlparse
+from typing import Any, List, Dict, Final, Tuple, Set, Iterator, Optional, FrozenSet, ClassVar
+from urllib.parse import urlparse, unquote
+from urllib.request import getproxies, proxy_bypass
+from concurrent.futures import ThreadPoolExecutor
+
+# Links never span lines, so neither part may contain a newline
+LINK_RE = re.compile(r'\[([^\]\n]+)\]\(([^)\n]+)\)')
+# Byte-level equivalents for scanning mmapped files; \r, \r\n and \n all end a line
+LINK_BYTES_RE = re.compile(rb'\[([^\]\r\n]+)\]\(([^)\r\n]+)\)')
+NEWLINE_BYTES_RE = re.compile(rb'\r\n?|\n')
+EXTERNAL_URL_RE = re.compile(r'^https?://')
+ANCHOR_HEADING_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+NON_ANCHOR_RE = re.compile(r'[^\w\-]')
+
+# ASCII equivalent of the heading-to-anchor steps below, for str.translate
+ANCHOR_TABLE: Dict[int, Optional[str]] = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i) in '_-')
+}
+ANCHOR_TABLE[ord(' ')] = '-'
+ANCHOR_TABLE[ord('_')] = '-'
+
+# Concurrent HEAD requests (and pooled connections) in --strict mode
+URL_CHECK_WORKERS = 32
+
+# External URL results, reused across runs for URL_CACHE_TTL seconds
+URL_CACHE_FILE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'validate_links' / 'urls.json'
+URL_CACHE_TTL = 86400
+# Client error statuses that may clear up on their own, so are never cached (nor is 5xx)
+TRANSIENT_STATUSES = frozenset({408, 429})
+
+# Directories never worth descending into when looking for docs
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv', 'dist', 'build'})
 
 # Color codes
 class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    RED: Final = '\033[91m'
+    GREEN: Final = '\033[92m'
+    YELLOW: Final = '\033[93m'
+    BLUE: Final = '\033[94m'
+    BOLD: Final = '\033[1m'
+    END: Final = '\033[0m'
 
 # Logging functions
 def print_info(msg: str) -> None:
@@ -55,18 +92,166 @@ def print_error(msg: str) -> None:
     """Print error message"""
     print(f"{Colors.RED}✗{Colors.END} {msg}")
 
+def iter_markdown_files(root: Path) -> Iterator[Path]:
+    """Yield markdown files under root, skipping SKIP_DIRS"""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            print_error(f"Cannot scan directory: {e}")
+
 class LinkValidator:
     """Validates links in markdown documents"""
     
-    def __init__(self, docs_path: str, strict: bool = False, fix: bool = False):
+    def __init__(self, docs_path: str, strict: bool = False, fix: bool = False,
+                 use_cache: bool = True, cache_ttl: float = URL_CACHE_TTL):
         """Initialize validator"""
         self.docs_path = Path(docs_path).resolve()
+        # Root for absolute (/...) links, kept as str for os.path joins
+        self._docs_root_str = str(self.docs_path.parent)
         self.strict = strict
         self.fix = fix
-        self.issues = []
-        self.validated_files = set()
-        self.link_regex = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-        self.external_url_regex = re.compile(r'^https?://')
+        self.use_cache = use_cache and strict
+        self.cache_ttl = cache_ttl
+        self.issues: List[Dict] = []
+        self.validated_files: Set[Path] = set()
+        # HTTP(S)_PROXY settings, honoured as requests did
+        self._proxies: Dict[str, str] = self._get_proxies() if strict else {}
+        # Pooled connections for --strict HEAD checks, keyed by proxy URL ('' for direct)
+        self._pools: Dict[str, urllib3.PoolManager] = self._create_pool_managers() if strict else {}
+        # (error string, checked-at) per URL, persisted between runs
+        self._url_cache: Dict[str, Tuple[str, float]] = self._load_url_cache() if self.use_cache else {}
+        # Everything under docs_path, walked on the first internal link so
+        # most link targets need no stat()
+        self._all_paths: Optional[Set[str]] = None
+        self._all_paths_lock = threading.Lock()
+        # os.path.exists() results for targets not found in _all_paths
+        self._exists_cache: Dict[str, bool] = {}
+        # Error string ('' when reachable) for each external URL already checked
+        now = time.time()
+        self._url_status: Dict[str, str] = {
+            url: status for url, (status, checked_at) in self._url_cache.items()
+            if now - checked_at < self.cache_ttl
+        }
+    
+    def _load_url_cache(self) -> Dict[str, Tuple[str, float]]:
+        """Load cached external URL results from disk"""
+        try:
+            with open(URL_CACHE_FILE, 'r') as f:
+                return {url: (status, checked_at) for url, (status, checked_at) in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print_warning(f"Ignoring unreadable URL cache: {e}")
+            return {}
+    
+    def _save_url_cache(self) -> None:
+        """Write unexpired URL results back to disk atomically"""
+        now = time.time()
+        entries = {
+            url: [status, checked_at] for url, (status, checked_at) in self._url_cache.items()
+            if now - checked_at < self.cache_ttl
+        }
+        tmp_file = URL_CACHE_FILE.with_suffix('.json.tmp')
+        try:
+            URL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_file, URL_CACHE_FILE)
+        except Exception as e:
+            print_warning(f"Cannot write URL cache: {e}")
+    
+    def _get_proxies(self) -> Dict[str, str]:
+        """Get the proxy URL for http and https from the environment"""
+        proxies = {}
+        for scheme, proxy in getproxies().items():
+            if scheme in ('http', 'https') and proxy:
+                proxies[scheme] = proxy if '://' in proxy else f"http://{proxy}"
+        return proxies
+    
+    def _create_pool_managers(self) -> Dict[str, urllib3.PoolManager]:
+        """Create connection pool managers that reuse connections across URL checks"""
+        options: Dict[str, Any] = {
+            'num_pools': URL_CHECK_WORKERS,
+            'maxsize': URL_CHECK_WORKERS,
+            'timeout': 5.0,
+            # One retry on connect/read errors; redirects are followed
+            'retries': Retry(total=10, connect=1, read=1, backoff_factor=0.1),
+        }
+        pools = {'': urllib3.PoolManager(**options)}
+        for proxy in set(self._proxies.values()):
+            parsed = urlparse(proxy)
+            headers = None
+            if parsed.username:
+                auth = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+                headers = urllib3.make_headers(proxy_basic_auth=auth)
+            pools[proxy] = urllib3.ProxyManager(proxy, proxy_headers=headers, **options)
+        return pools
+    
+    def _pool_for(self, url: str) -> urllib3.PoolManager:
+        """Pick the direct or proxied pool manager for url, respecting NO_PROXY"""
+        proxy = self._proxies.get(url.partition(':')[0].lower(), '')
+        if proxy and proxy_bypass(urlparse(url).hostname or ''):
+            proxy = ''
+        return self._pools[proxy]
+    
+    def _walk_paths(self) -> Set[str]:
+        """Collect every file and directory under docs_path in one walk"""
+        docs_path_str = str(self.docs_path)
+        paths = {docs_path_str}
+        for root, dirs, files in os.walk(docs_path_str):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            paths.update(os.path.join(root, name) for name in dirs)
+            paths.update(os.path.join(root, name) for name in files)
+        return paths
+    
+    def _exists(self, path: str) -> bool:
+        """os.path.exists() with results remembered for the rest of the run"""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = os.path.exists(path)
+        return exists
+    
+    def _check_url(self, url: str) -> str:
+        """HEAD an external URL, returning an error string or '' if reachable"""
+        try:
+            response = self._pool_for(url).request('HEAD', url)
+        except Exception as e:
+            # Network failures may be transient, so they are not cached
+            return f"External link check failed: {str(e)}"
+        
+        status = f"HTTP {response.status}" if response.status >= 400 else ""
+        # Timeouts, rate limits and server errors hold for this run only
+        if response.status < 500 and response.status not in TRANSIENT_STATUSES:
+            self._url_cache[url] = (status, time.time())
+        return status
+    
+    def check_external_urls(self, files: List[Path]) -> None:
+        """Check every distinct external URL in files concurrently, once each"""
+        urls = set()
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except Exception:
+                continue  # Reported when the file itself is validated
+            for match in LINK_RE.finditer(content):
+                if EXTERNAL_URL_RE.match(match.group(2)):
+                    urls.add(match.group(2))
+        
+        urls -= self._url_status.keys()
+        if not urls:
+            return
+        
+        print_info(f"Checking {len(urls)} external URLs")
+        with ThreadPoolExecutor(max_workers=URL_CHECK_WORKERS) as executor:
+            self._url_status.update(zip(urls, executor.map(self._check_url, urls)))
         
     def get_markdown_files(self) -> List[Path]:
         """Get all markdown files in docs path"""
@@ -75,15 +260,20 @@ class LinkValidator:
             if self.docs_path.suffix == '.md':
                 files.append(self.docs_path)
         else:
-            files = list(self.docs_path.rglob('*.md'))
+            files = list(iter_markdown_files(self.docs_path))
         
         return sorted(files)
     
     def validate_file(self, file_path: Path) -> Dict:
         """Validate links in a single file"""
         print_info(f"Validating: {file_path.relative_to(self.docs_path)}")
-        
-        result = {
+        result = self._check_file(file_path)
+        self.validated_files.add(file_path)
+        return result
+    
+    def _check_file(self, file_path: Path) -> Dict:
+        """Collect link errors for a single file without printing"""
+        result: Dict[str, Any] = {
             'file': file_path,
             'errors': [],
             'warnings': [],
@@ -91,30 +281,34 @@ class LinkValidator:
         }
         
         try:
-            content = file_path.read_text(encoding='utf-8')
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return result
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         except Exception as e:
             result['errors'].append(f"Cannot read file: {e}")
             return result
         
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            # Find all links in line
-            for match in self.link_regex.finditer(line):
-                link_text = match.group(1)
-                link_url = match.group(2)
+        with mm:
+            # Newline offsets, built only once a line number is needed
+            newlines = None
+            
+            # Find all links in one pass over the raw bytes
+            for match in LINK_BYTES_RE.finditer(mm):
+                link_url = match.group(2).decode('utf-8', 'replace')
                 
                 # Validate the link
                 error = self._validate_link(link_url, file_path)
                 if error:
+                    if newlines is None:
+                        newlines = [m.start() for m in NEWLINE_BYTES_RE.finditer(mm)]
                     result['errors'].append({
-                        'line': line_num,
-                        'text': link_text,
+                        'line': bisect_right(newlines, match.start()) + 1,
+                        'text': match.group(1).decode('utf-8', 'replace'),
                         'url': link_url,
                         'error': error
                     })
         
-        self.validated_files.add(file_path)
         return result
     
     def _validate_link(self, url: str, file_path: Path) -> str:
@@ -125,47 +319,31 @@ class LinkValidator:
             return ""
         
         # Check external URLs
-        if self.external_url_regex.match(url):
+        if EXTERNAL_URL_RE.match(url):
             if self.strict:
-                try:
-                    response = requests.head(url, timeout=5)
-                    if response.status_code >= 400:
-                        return f"HTTP {response.status_code}"
-                except Exception as e:
-                    return f"External link check failed: {str(e)}"
+                status = self._url_status.get(url)
+                if status is None:
+                    status = self._url_status[url] = self._check_url(url)
+                return status
             return ""
         
-        # Check internal links
-        if url.startswith('/'):
+        # Check internal links, without any anchor
+        path = url.partition('#')[0]
+        if path.startswith('/'):
             # Absolute path from root
-            target = Path(self.docs_path.parent) / url.lstrip('/')
-        elif url.startswith('./'):
-            # Relative to current file
-            target = file_path.parent / url
-        elif url.startswith('../'):
-            # Parent directory reference
-            target = (file_path.parent / url).resolve()
+            target = os.path.join(self._docs_root_str, path.lstrip('/'))
         else:
             # Relative to current file
-            target = file_path.parent / url
+            target = os.path.join(os.path.dirname(file_path), path)
+        target = os.path.normpath(target)
         
-        # Remove anchor if present
-        if '#' in str(target):
-            target = Path(str(target).split('#')[0])
+        if self._all_paths is None:
+            with self._all_paths_lock:
+                if self._all_paths is None:
+                    self._all_paths = self._walk_paths()
         
-        # Check if target exists
-        if not target.exists():
-            # Try to find in docs directory
-            if target.is_absolute():
-                relative = target.relative_to(self.docs_path.parent)
-            else:
-                relative = target
-            
-            # Look for file in docs
-            alt_path = self.docs_path.parent / str(relative).lstrip('/')
-            if alt_path.exists():
-                return ""
-            
+        # Check if target exists; stat() only what the walk did not see
+        if target not in self._all_paths and not self._exists(target):
             return f"File not found: {target}"
         
         return ""
@@ -235,10 +413,19 @@ class LinkValidator:
         print_info(f"Found {len(files)} markdown files")
         print()
         
+        if self.strict:
+            self.check_external_urls(files)
+        
+        # Overlap file reads and link checks; map() keeps results in file order
         results = []
-        for file_path in files:
-            result = self.validate_file(file_path)
-            results.append(result)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            for file_path, result in zip(files, executor.map(self._check_file, files)):
+                print_info(f"Validating: {file_path.relative_to(self.docs_path)}")
+                self.validated_files.add(file_path)
+                results.append(result)
+        
+        if self.use_cache:
+            self._save_url_cache()
         
         errors, warnings, fixed = self.generate_report(results)
         
@@ -247,31 +434,46 @@ class LinkValidator:
 class AnchorValidator:
     """Validates that anchor references match headings"""
     
+    # Extracted headings shared across instances, keyed by path and validated by mtime
+    _headings_cache: ClassVar[Dict[Path, Tuple[int, Dict[str, str]]]] = {}
+    
     def __init__(self, file_path: Path):
         """Initialize validator"""
         self.file_path = file_path
-        self.headings = {}
+        # Anchor keys, loaded on the first validate_anchor call
+        self._headings: Optional[FrozenSet[str]] = None
         
-    def extract_headings(self) -> Dict[str, int]:
+    def extract_headings(self) -> Dict[str, str]:
         """Extract all headings from file"""
+        mtime = self.file_path.stat().st_mtime_ns
+        cached = self._headings_cache.get(self.file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
         content = self.file_path.read_text(encoding='utf-8')
-        heading_regex = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
         
         headings = {}
-        for match in heading_regex.finditer(content):
+        for match in ANCHOR_HEADING_RE.finditer(content):
             heading_text = match.group(1)
             # Convert to anchor format
-            anchor = heading_text.lower().replace(' ', '-').replace('_', '-')
-            # Remove special characters
-            anchor = re.sub(r'[^\w\-]', '', anchor)
+            anchor = heading_text.lower()
+            if anchor.isascii():
+                # Spaces and underscores to hyphens, special characters removed
+                anchor = anchor.translate(ANCHOR_TABLE)
+            else:
+                anchor = anchor.replace(' ', '-').replace('_', '-')
+                # Remove special characters
+                anchor = NON_ANCHOR_RE.sub('', anchor)
             headings[anchor] = heading_text
         
+        self._headings_cache[self.file_path] = (mtime, headings)
         return headings
     
     def validate_anchor(self, anchor: str) -> bool:
         """Check if anchor exists in file"""
-        headings = self.extract_headings()
-        return anchor in headings
+        if self._headings is None:
+            self._headings = frozenset(self.extract_headings())
+        return anchor in self._headings
 
 def main():
     """Main function"""
@@ -282,6 +484,7 @@ def main():
 Examples:
   python3 validate_links.py docs/
   python3 validate_links.py docs/ --strict
+  python3 validate_links.py docs/ --strict --no-cache
   python3 validate_links.py docs/*.md
         '''
     )
@@ -303,10 +506,29 @@ Examples:
         help='Attempt to fix common issues'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-check every external URL instead of using cached results'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=URL_CACHE_TTL,
+        help=f'Seconds to trust cached external URL results (default: {URL_CACHE_TTL})'
+    )
+    
     args = parser.parse_args()
     
     # Create validator
-    validator = LinkValidator(args.path, strict=args.strict, fix=args.fix)
+    validator = LinkValidator(
+        args.path,
+        strict=args.strict,
+        fix=args.fix,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl
+    )
     
     # Run validation
     exit_code = validator.validate_all()